@@ -7,7 +7,7 @@ from rest_framework_simplejwt.views import (
 )
 
 def redirect_to_api(request):
-    return redirect('api/')
+    return redirect('api/events/')
 
 urlpatterns = [
     # Root URL redirect to API
@@ -0,0 +1,34 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that remembers which tokens have been validated.
+    Repeat requests with the same access token skip signature and claim
+    verification until the cache entry expires.
+    """
+    cache_timeout = 300
+
+    def get_validated_token(self, raw_token):
+        # Key by digest and store only the token type, so neither the raw
+        # token nor its claims end up in the cache
+        key = f'jwt:{hashlib.sha256(raw_token).hexdigest()}'
+        token_type = cache.get(key)
+        if token_type is not None:
+            for AuthToken in api_settings.AUTH_TOKEN_CLASSES:
+                if AuthToken.token_type == token_type:
+                    # Verified when the entry was cached; just decode it
+                    return AuthToken(raw_token, verify=False)
+
+        validated_token = super().get_validated_token(raw_token)
+
+        # Never cache a token past its own expiry
+        timeout = min(self.cache_timeout, validated_token['exp'] - int(time.time()))
+        if timeout > 0:
+            cache.set(key, validated_token.token_type, timeout=timeout)
+        return validated_token
@@ -0,0 +1,54 @@
+import time
+from functools import wraps
+
+from django.core.cache import cache
+from django.views.decorators.cache import cache_page
+
+
+EVENT_LIST_VERSION_KEY = 'events:list:version'
+
+
+def get_event_list_version():
+    """
+    Return the current version of the cached event list.
+    Seeded from the clock so an evicted key never revives old pages.
+    """
+    return cache.get_or_set(EVENT_LIST_VERSION_KEY, time.time_ns, timeout=None)
+
+
+def bump_event_list_version():
+    """Invalidate every cached event list page at once"""
+    try:
+        cache.incr(EVENT_LIST_VERSION_KEY)
+    except ValueError:
+        cache.set(EVENT_LIST_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def cache_event_list(timeout):
+    """
+    Like cache_page, but the key prefix carries the event list version,
+    so bumping the version expires all cached pages without a key scan.
+    The cache is server-side only: clients are told to revalidate, since
+    a version bump can't reach copies held by browsers or proxies.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            key_prefix = f'events:list:v{get_event_list_version()}'
+            cached_view = cache_page(timeout, key_prefix=key_prefix)(view_func)
+            response = cached_view(request, *args, **kwargs)
+            # cache_page stores unrendered responses from a post-render
+            # callback, so rewrite the headers after it has run
+            if hasattr(response, 'add_post_render_callback'):
+                response.add_post_render_callback(_disable_client_caching)
+            else:
+                _disable_client_caching(response)
+            return response
+        return _wrapped_view
+    return decorator
+
+
+def _disable_client_caching(response):
+    """Replace the max-age/Expires headers cache_page adds"""
+    response['Cache-Control'] = 'private, no-cache'
+    del response['Expires']
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-14 17:14
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_review_review_rating_1_5'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('going_count', models.IntegerField(default=0)),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_total', models.IntegerField(default=0)),
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='events.event')),
+            ],
+            options={
+                'verbose_name': 'Event Stats',
+                'verbose_name_plural': 'Event Stats',
+            },
+        ),
+    ]
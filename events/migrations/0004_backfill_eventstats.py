@@ -0,0 +1,48 @@
+# Generated by Django 4.2.7 on 2026-10-14 17:14
+
+from django.db import migrations
+from django.db.models import Count, Sum
+
+
+def backfill_event_stats(apps, schema_editor):
+    Event = apps.get_model('events', 'Event')
+    EventStats = apps.get_model('events', 'EventStats')
+    RSVP = apps.get_model('events', 'RSVP')
+    Review = apps.get_model('events', 'Review')
+
+    going = dict(
+        RSVP.objects.filter(status='Going')
+        .order_by()
+        .values_list('event_id')
+        .annotate(count=Count('id'))
+    )
+    reviews = {
+        row['event_id']: row
+        for row in Review.objects.order_by()
+        .values('event_id')
+        .annotate(count=Count('id'), total=Sum('rating'))
+    }
+
+    EventStats.objects.bulk_create(
+        [
+            EventStats(
+                event_id=event_id,
+                going_count=going.get(event_id, 0),
+                review_count=reviews.get(event_id, {}).get('count', 0),
+                rating_total=reviews.get(event_id, {}).get('total', 0),
+            )
+            for event_id in Event.objects.values_list('id', flat=True)
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_eventstats'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_event_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-14 17:16
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_backfill_eventstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='eventstats',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
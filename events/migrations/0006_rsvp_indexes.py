@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-14 17:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_eventstats_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rsvp',
+            index=models.Index(fields=['event', 'status'], name='events_rsvp_event_i_6bb8a2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rsvp',
+            index=models.Index(condition=models.Q(('status', 'Going')), fields=['event'], name='rsvp_going_idx'),
+        ),
+    ]
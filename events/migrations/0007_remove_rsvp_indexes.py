@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-14 17:34
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_rsvp_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='rsvp',
+            name='events_rsvp_event_i_6bb8a2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='rsvp',
+            name='rsvp_going_idx',
+        ),
+    ]
@@ -56,16 +56,45 @@ class Event(models.Model):
     
     @property
     def rsvp_count(self):
-        """Get count of users who RSVPed as 'Going'"""
-        return self.rsvps.filter(status='Going').count()
+        """Get count of users who RSVPed as 'Going', kept on EventStats"""
+        return self.stats.going_count
     
     @property
     def average_rating(self):
-        """Calculate average rating from reviews"""
-        reviews = self.reviews.all()
-        if reviews.exists():
-            return round(sum(r.rating for r in reviews) / reviews.count(), 1)
-        return None
+        """Get average rating from reviews, kept on EventStats"""
+        return self.stats.average_rating
+
+
+class EventStats(models.Model):
+    """
+    Denormalized RSVP and review totals for an event.
+    Kept current by RSVP/Review signals so reads need no aggregation.
+    """
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, related_name='stats')
+    going_count = models.IntegerField(default=0)
+    review_count = models.IntegerField(default=0)
+    # Stored as a sum so signals can adjust it atomically with F()
+    rating_total = models.IntegerField(default=0)
+    # Touched on every RSVP/Review change; drives event detail Last-Modified
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Event Stats"
+        verbose_name_plural = "Event Stats"
+    
+    def __str__(self):
+        return f"{self.event.title} stats"
+    
+    @property
+    def average_rating(self):
+        """Average review rating, rounded to one decimal"""
+        return self.compute_average(self.rating_total, self.review_count)
+    
+    @staticmethod
+    def compute_average(rating_total, review_count):
+        if not review_count:
+            return None
+        return round(rating_total / review_count, 1)
 
 
 class RSVP(models.Model):
@@ -78,6 +107,7 @@ class RSVP(models.Model):
         ('Maybe', 'Maybe'),
         ('Not Going', 'Not Going'),
     ]
+    STATUS_VALUES = tuple(choice[0] for choice in STATUS_CHOICES)
     
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='rsvps')
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='rsvps')
@@ -91,6 +121,13 @@ class RSVP(models.Model):
         verbose_name_plural = "RSVPs"
         ordering = ['-created_at']
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # Remember the stored status so signals can update EventStats by delta
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+    
     def __str__(self):
         return f"{self.user.username} - {self.event.title} ({self.status})"
 
@@ -110,11 +147,26 @@ class Review(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
+        # One review per user per event. The views rely on this constraint
+        # instead of checking for an existing review before inserting.
         unique_together = ['event', 'user']
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['event', '-created_at']),
         ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(rating__gte=1, rating__lte=5),
+                name='review_rating_1_5',
+            ),
+        ]
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # Remember the stored rating so signals can update EventStats by delta
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = instance.__dict__.get('rating')
+        return instance
     
     def __str__(self):
         return f"{self.user.username} - {self.event.title} ({self.rating}★)"
\ No newline at end of file
@@ -0,0 +1,17 @@
+from rest_framework.pagination import CursorPagination
+
+
+class EventCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the event list.
+    Seeks on start_time, so deep pages cost the same as the first one.
+    """
+    ordering = '-start_time'
+
+
+class UserProfileCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the profile list.
+    The ordering comes from UserProfileViewSet through OrderingFilter.
+    """
+    ordering = None
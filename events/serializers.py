@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth.models import User
-from .models import UserProfile, Event, RSVP, Review
+from .models import UserProfile, Event, EventStats, RSVP, Review
 
 
 class UserProfileSerializer(serializers.ModelSerializer):
@@ -32,17 +32,11 @@ class ReviewSerializer(serializers.ModelSerializer):
         fields = ['id', 'event', 'user', 'user_id', 'rating', 'comment', 'created_at']
         read_only_fields = ['event', 'user', 'created_at']
     
-    def validate_rating(self, value):
-        """Ensure rating is between 1 and 5"""
-        if not 1 <= value <= 5:
-            raise serializers.ValidationError("Rating must be between 1 and 5.")
-        return value
-    
     def create(self, validated_data):
         # Remove user_id if present, we'll use context
         validated_data.pop('user_id', None)
-        validated_data['user'] = self.context['request'].user
-        validated_data['event'] = self.context['event']
+        validated_data.setdefault('user', self.context['request'].user)
+        validated_data.setdefault('event', self.context.get('event'))
         return super().create(validated_data)
 
 
@@ -58,31 +52,51 @@ class RSVPSerializer(serializers.ModelSerializer):
     
     def validate_status(self, value):
         """Ensure status is valid"""
-        valid_statuses = [choice[0] for choice in RSVP.STATUS_CHOICES]
-        if value not in valid_statuses:
-            raise serializers.ValidationError(f"Status must be one of: {', '.join(valid_statuses)}")
+        if value not in RSVP.STATUS_VALUES:
+            raise serializers.ValidationError(f"Status must be one of: {', '.join(RSVP.STATUS_VALUES)}")
         return value
 
 
-class EventListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for listing events"""
-    organizer = UserBasicSerializer(read_only=True)
-    rsvp_count = serializers.IntegerField(read_only=True)
-    average_rating = serializers.FloatField(read_only=True)
+class EventListSerializer(serializers.BaseSerializer):
+    """
+    Lightweight read-only serializer for listing events.
+    Reshapes the flat values() rows from EventViewSet into the list
+    representation without building model instances or bound fields.
+    """
+    # The values() columns to_representation reads; EventViewSet selects these
+    columns = (
+        'id', 'title', 'location', 'start_time', 'end_time', 'is_public',
+        'organizer_id', 'organizer__username', 'organizer__profile__full_name',
+        'stats__going_count', 'stats__review_count', 'stats__rating_total',
+        'user_rsvp_status',
+    )
     
-    class Meta:
-        model = Event
-        fields = [
-            'id', 'title', 'location', 'start_time', 'end_time', 
-            'organizer', 'is_public', 'rsvp_count', 'average_rating'
-        ]
+    def to_representation(self, row):
+        return {
+            'id': row['id'],
+            'title': row['title'],
+            'location': row['location'],
+            'start_time': row['start_time'],
+            'end_time': row['end_time'],
+            'organizer': {
+                'id': row['organizer_id'],
+                'username': row['organizer__username'],
+                'full_name': row['organizer__profile__full_name'],
+            },
+            'is_public': row['is_public'],
+            'rsvp_count': row['stats__going_count'],
+            'average_rating': EventStats.compute_average(
+                row['stats__rating_total'], row['stats__review_count']
+            ),
+            'user_rsvp_status': row['user_rsvp_status'],
+        }
 
 
 class EventDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer with all event information and relations"""
     organizer = UserBasicSerializer(read_only=True)
-    rsvp_count = serializers.IntegerField(read_only=True)
-    average_rating = serializers.FloatField(read_only=True)
+    rsvp_count = serializers.IntegerField(source='stats.going_count', read_only=True)
+    average_rating = serializers.FloatField(source='stats.average_rating', read_only=True)
     reviews = ReviewSerializer(many=True, read_only=True)
     user_rsvp_status = serializers.SerializerMethodField()
     
@@ -98,6 +112,9 @@ class EventDetailSerializer(serializers.ModelSerializer):
     
     def get_user_rsvp_status(self, obj):
         """Get current user's RSVP status for this event"""
+        # EventViewSet annotates the status onto its queryset
+        if hasattr(obj, 'user_rsvp_status'):
+            return obj.user_rsvp_status
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             rsvp = obj.rsvps.filter(user=request.user).first()
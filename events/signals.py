@@ -1,7 +1,11 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from django.utils import timezone
 from django.contrib.auth.models import User
-from .models import UserProfile
+from .models import UserProfile, Event, EventStats, RSVP, Review
+from .cache import bump_event_list_version
 
 
 @receiver(post_save, sender=User)
@@ -14,11 +18,77 @@ def create_user_profile(sender, instance, created, **kwargs):
         UserProfile.objects.create(user=instance)
 
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
+@receiver(post_save, sender=Event)
+def create_event_stats(sender, instance, created, **kwargs):
+    """Give every new event an empty EventStats row"""
+    if created:
+        EventStats.objects.create(event=instance)
+
+
+def _adjust_event_stats(event_id, **deltas):
+    """
+    Apply counter deltas to an event's stats in a single UPDATE.
+    Always bumps updated_at, since any RSVP or review change alters
+    what the event detail shows.
+    """
+    EventStats.objects.filter(event_id=event_id).update(
+        updated_at=timezone.now(),
+        **{field: F(field) + delta for field, delta in deltas.items()}
+    )
+
+
+@receiver(post_save, sender=RSVP)
+def update_going_count(sender, instance, created, **kwargs):
+    """Keep EventStats.going_count in step with RSVP status changes"""
+    previous = None if created else getattr(instance, '_loaded_status', None)
+    delta = (instance.status == 'Going') - (previous == 'Going')
+    _adjust_event_stats(instance.event_id, going_count=delta)
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=RSVP)
+def remove_going_count(sender, instance, **kwargs):
+    """Drop a deleted 'Going' RSVP from EventStats.going_count"""
+    was_going = getattr(instance, '_loaded_status', instance.status) == 'Going'
+    _adjust_event_stats(instance.event_id, going_count=-1 if was_going else 0)
+
+
+@receiver(post_save, sender=Review)
+def update_review_totals(sender, instance, created, **kwargs):
+    """Keep EventStats review totals in step with new and edited reviews"""
+    if created:
+        _adjust_event_stats(
+            instance.event_id, review_count=1, rating_total=instance.rating
+        )
+    else:
+        previous = getattr(instance, '_loaded_rating', None) or instance.rating
+        _adjust_event_stats(
+            instance.event_id, rating_total=instance.rating - previous
+        )
+    instance._loaded_rating = instance.rating
+
+
+@receiver(post_delete, sender=Review)
+def remove_review_totals(sender, instance, **kwargs):
+    """Drop a deleted review from EventStats review totals"""
+    rating = getattr(instance, '_loaded_rating', None) or instance.rating
+    _adjust_event_stats(instance.event_id, review_count=-1, rating_total=-rating)
+
+
+@receiver([post_save, post_delete], sender=Event)
+@receiver([post_save, post_delete], sender=RSVP)
+@receiver([post_save, post_delete], sender=Review)
+@receiver([post_save, post_delete], sender=User)
+@receiver([post_save, post_delete], sender=UserProfile)
+def invalidate_event_list_cache(sender, update_fields=None, **kwargs):
     """
-    Save the UserProfile whenever the User is saved.
-    Handles cases where profile might not exist.
+    Expire cached event list pages whenever data they show changes.
+    RSVPs and reviews feed rsvp_count and average_rating; users and
+    profiles supply the organizer's username and full_name.
     """
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
\ No newline at end of file
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        # Logins re-save the user without changing anything listed
+        return
+    # Wait for the commit, or a list request in between could cache the
+    # old rows under the new version
+    transaction.on_commit(bump_event_list_version)
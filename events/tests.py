@@ -1,3 +1,407 @@
-from django.test import TestCase
+import hashlib
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from importlib import import_module
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .authentication import CachedJWTAuthentication
+from .cache import get_event_list_version
+from .models import Event, EventStats, RSVP, Review
+from .renderers import ORJSONRenderer
+from .views import EventViewSet
+
+
+def create_event(organizer, title='Meetup', **kwargs):
+    start = timezone.now() + timedelta(days=1)
+    return Event.objects.create(
+        title=title,
+        description='Monthly meetup',
+        organizer=organizer,
+        location='Berlin',
+        start_time=start,
+        end_time=start + timedelta(hours=2),
+        **kwargs
+    )
+
+
+class EventStatsSignalTests(TestCase):
+    """EventStats counters must track RSVP and Review writes exactly"""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user('organizer', password='pass')
+        self.alice = User.objects.create_user('alice', password='pass')
+        self.bob = User.objects.create_user('bob', password='pass')
+        self.event = create_event(self.organizer)
+
+    def stats(self):
+        return EventStats.objects.get(event=self.event)
+
+    def test_new_event_gets_empty_stats(self):
+        stats = self.stats()
+        self.assertEqual(stats.going_count, 0)
+        self.assertEqual(stats.review_count, 0)
+        self.assertEqual(stats.rating_total, 0)
+        self.assertIsNone(stats.average_rating)
+
+    def test_rsvp_create_counts_only_going(self):
+        RSVP.objects.create(event=self.event, user=self.alice, status='Going')
+        RSVP.objects.create(event=self.event, user=self.bob, status='Maybe')
+        self.assertEqual(self.stats().going_count, 1)
+
+    def test_rsvp_status_flips_on_loaded_instance(self):
+        RSVP.objects.create(event=self.event, user=self.alice, status='Maybe')
+
+        rsvp = RSVP.objects.get(event=self.event, user=self.alice)
+        rsvp.status = 'Going'
+        rsvp.save()
+        self.assertEqual(self.stats().going_count, 1)
+
+        rsvp = RSVP.objects.get(pk=rsvp.pk)
+        rsvp.status = 'Not Going'
+        rsvp.save()
+        self.assertEqual(self.stats().going_count, 0)
+
+    def test_rsvp_resaved_without_status_change(self):
+        rsvp = RSVP.objects.get(
+            pk=RSVP.objects.create(event=self.event, user=self.alice, status='Going').pk
+        )
+        rsvp.save()
+        self.assertEqual(self.stats().going_count, 1)
+
+    def test_rsvp_repeated_saves_on_created_instance(self):
+        # No from_db snapshot here; post_save must track the saved status
+        rsvp = RSVP.objects.create(event=self.event, user=self.alice, status='Going')
+        rsvp.status = 'Maybe'
+        rsvp.save()
+        self.assertEqual(self.stats().going_count, 0)
+        rsvp.status = 'Going'
+        rsvp.save()
+        rsvp.save()
+        self.assertEqual(self.stats().going_count, 1)
+
+    def test_rsvp_update_or_create(self):
+        RSVP.objects.update_or_create(
+            event=self.event, user=self.alice, defaults={'status': 'Going'}
+        )
+        RSVP.objects.update_or_create(
+            event=self.event, user=self.alice, defaults={'status': 'Maybe'}
+        )
+        self.assertEqual(self.stats().going_count, 0)
+
+    def test_rsvp_delete(self):
+        RSVP.objects.create(event=self.event, user=self.alice, status='Going')
+        RSVP.objects.create(event=self.event, user=self.bob, status='Maybe')
+
+        RSVP.objects.get(user=self.bob).delete()
+        self.assertEqual(self.stats().going_count, 1)
+
+        RSVP.objects.get(user=self.alice).delete()
+        self.assertEqual(self.stats().going_count, 0)
+
+    def test_rsvp_delete_uses_stored_status(self):
+        RSVP.objects.create(event=self.event, user=self.alice, status='Going')
+        rsvp = RSVP.objects.get(user=self.alice)
+        rsvp.status = 'Maybe'  # unsaved change
+        rsvp.delete()
+        self.assertEqual(self.stats().going_count, 0)
+
+    def test_review_create_edit_delete(self):
+        Review.objects.create(event=self.event, user=self.alice, rating=4)
+        Review.objects.create(event=self.event, user=self.bob, rating=5)
+        stats = self.stats()
+        self.assertEqual((stats.review_count, stats.rating_total), (2, 9))
+        self.assertEqual(stats.average_rating, 4.5)
+
+        review = Review.objects.get(user=self.alice)
+        review.rating = 1
+        review.save()
+        stats = self.stats()
+        self.assertEqual((stats.review_count, stats.rating_total), (2, 6))
+        self.assertEqual(stats.average_rating, 3.0)
+
+        Review.objects.get(user=self.bob).delete()
+        stats = self.stats()
+        self.assertEqual((stats.review_count, stats.rating_total), (1, 1))
+
+    def test_review_repeated_edits_on_created_instance(self):
+        review = Review.objects.create(event=self.event, user=self.alice, rating=2)
+        review.rating = 5
+        review.save()
+        review.rating = 3
+        review.save()
+        stats = self.stats()
+        self.assertEqual((stats.review_count, stats.rating_total), (1, 3))
+
+    def test_review_delete_uses_stored_rating(self):
+        Review.objects.create(event=self.event, user=self.alice, rating=4)
+        review = Review.objects.get(user=self.alice)
+        review.rating = 2  # unsaved change
+        review.delete()
+        stats = self.stats()
+        self.assertEqual((stats.review_count, stats.rating_total), (0, 0))
+
+    def test_writes_touch_updated_at(self):
+        before = self.stats().updated_at
+        RSVP.objects.create(event=self.event, user=self.alice, status='Maybe')
+        self.assertGreater(self.stats().updated_at, before)
+
+    def test_event_properties_read_stats(self):
+        RSVP.objects.create(event=self.event, user=self.alice, status='Going')
+        Review.objects.create(event=self.event, user=self.alice, rating=3)
+        Review.objects.create(event=self.event, user=self.bob, rating=4)
+
+        event = Event.objects.get(pk=self.event.pk)
+        self.assertEqual(event.rsvp_count, 1)
+        self.assertEqual(event.average_rating, 3.5)
+
+    def test_backfill_matches_signals(self):
+        RSVP.objects.create(event=self.event, user=self.alice, status='Going')
+        RSVP.objects.create(event=self.event, user=self.bob, status='Going')
+        Review.objects.create(event=self.event, user=self.alice, rating=2)
+        expected = self.stats()
+
+        EventStats.objects.all().delete()
+        migration = import_module('events.migrations.0004_backfill_eventstats')
+        migration.backfill_event_stats(apps, None)
+
+        stats = self.stats()
+        self.assertEqual(
+            (stats.going_count, stats.review_count, stats.rating_total),
+            (expected.going_count, expected.review_count, expected.rating_total),
+        )
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    """Repeat tokens skip verification without the token landing in the cache"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user('alice', password='pass')
+        self.raw_token = str(AccessToken.for_user(self.user))
+        self.key = f'jwt:{hashlib.sha256(self.raw_token.encode()).hexdigest()}'
+
+    def authenticate(self):
+        request = RequestFactory().get(
+            '/', HTTP_AUTHORIZATION=f'Bearer {self.raw_token}'
+        )
+        return CachedJWTAuthentication().authenticate(request)
+
+    def test_repeat_request_served_from_cache(self):
+        verify = mock.patch.object(
+            JWTAuthentication, 'get_validated_token', autospec=True,
+            side_effect=JWTAuthentication.get_validated_token,
+        )
+        with verify as get_validated_token:
+            first_user, first_token = self.authenticate()
+            second_user, second_token = self.authenticate()
+
+        self.assertEqual(get_validated_token.call_count, 1)
+        self.assertEqual(first_user, self.user)
+        self.assertEqual(second_user, self.user)
+        self.assertEqual(second_token.payload, first_token.payload)
+
+    def test_cache_entry_holds_no_token(self):
+        self.authenticate()
+        entry = cache.get(self.key)
+        self.assertEqual(entry, 'access')
+        self.assertNotIn(self.raw_token, repr(entry))
+
+
+class EventDetailConditionalTests(TestCase):
+    """Event detail ETags must change with anything the detail shows"""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user('organizer', password='pass')
+        self.alice = User.objects.create_user('alice', password='pass')
+        self.bob = User.objects.create_user('bob', password='pass')
+        self.event = create_event(self.organizer)
+        self.url = f'/api/events/{self.event.pk}/'
+
+    def client_for(self, user=None):
+        client = APIClient()
+        if user is not None:
+            client.force_authenticate(user)
+        return client
+
+    def test_unchanged_event_is_not_modified(self):
+        client = self.client_for()
+        response = client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Authorization', response['Vary'])
+
+        response = client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_detail_queries(self):
+        # ETag row, event row, prefetched reviews
+        with self.assertNumQueries(3):
+            self.client_for().get(self.url)
+
+    def test_rsvp_changes_etag(self):
+        client = self.client_for(self.alice)
+        etag = client.get(self.url)['ETag']
+
+        RSVP.objects.create(event=self.event, user=self.alice, status='Going')
+        response = client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['user_rsvp_status'], 'Going')
+
+    def test_organizer_rename_changes_etag(self):
+        client = self.client_for()
+        etag = client.get(self.url)['ETag']
+
+        self.organizer.profile.full_name = 'Olga Organizer'
+        self.organizer.profile.save()
+        response = client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_is_per_caller(self):
+        etag = self.client_for(self.alice).get(self.url)['ETag']
+        response = self.client_for(self.bob).get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_private_event_is_not_found_for_others(self):
+        event = create_event(self.organizer, is_public=False)
+        url = f'/api/events/{event.pk}/'
+        etag = self.client_for(self.organizer).get(url)['ETag']
+
+        response = self.client_for().get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 404)
+
+
+class EventListCacheTests(TestCase):
+    """The event list is cached server-side and expires on relevant writes"""
+    url = '/api/events/'
+
+    def setUp(self):
+        cache.clear()
+        self.organizer = User.objects.create_user('organizer', password='pass')
+        self.alice = User.objects.create_user('alice', password='pass')
+        self.event = create_event(self.organizer)
+        self.client = APIClient()
+
+    def test_repeat_request_served_from_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+    def test_clients_must_revalidate(self):
+        # Cache-Control is rewritten after cache_page has stored the
+        # response, so check both the fresh response and the cache hit
+        for response in (self.client.get(self.url), self.client.get(self.url)):
+            self.assertEqual(response['Cache-Control'], 'private, no-cache')
+            self.assertNotIn('Expires', response)
+
+    def test_rsvp_expires_cache_after_commit(self):
+        self.client.get(self.url)
+        version = get_event_list_version()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            RSVP.objects.create(event=self.event, user=self.alice, status='Going')
+        self.assertEqual(get_event_list_version(), version)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_event_list_version(), version)
+        results = self.client.get(self.url).json()['results']
+        self.assertEqual(results[0]['rsvp_count'], 1)
+
+    def test_profile_rename_expires_cache(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.organizer.profile.full_name = 'Olga Organizer'
+            self.organizer.profile.save()
+
+        results = self.client.get(self.url).json()['results']
+        self.assertEqual(results[0]['organizer']['full_name'], 'Olga Organizer')
+
+    def test_login_keeps_cache(self):
+        version = get_event_list_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.organizer.last_login = timezone.now()
+            self.organizer.save(update_fields=['last_login'])
+        self.assertEqual(get_event_list_version(), version)
+
+
+class EventListPaginationTests(TestCase):
+    """Every ordering the list accepts must page through all events"""
+
+    def setUp(self):
+        cache.clear()
+        organizer = User.objects.create_user('organizer', password='pass')
+        # More than one page, with start_time and title in different orders
+        self.events = [
+            create_event(organizer, title=f'Event {(i * 7) % 12:02}')
+            for i in range(12)
+        ]
+        for i, event in enumerate(self.events):
+            Event.objects.filter(pk=event.pk).update(
+                start_time=event.start_time + timedelta(hours=(i * 5) % 12)
+            )
+
+    def walk(self, ordering):
+        client = APIClient()
+        ids = []
+        url = f'/api/events/?ordering={ordering}'
+        while url:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [event['id'] for event in response.json()['results']]
+            url = response.json()['next']
+        return ids
+
+    def test_every_ordering_field(self):
+        for field in EventViewSet.ordering_fields:
+            for ordering in (field, f'-{field}'):
+                with self.subTest(ordering=ordering):
+                    expected = list(
+                        Event.objects.order_by(ordering).values_list('pk', flat=True)
+                    )
+                    self.assertEqual(self.walk(ordering), expected)
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """ORJSONRenderer must produce the same bytes as DRF's JSONRenderer"""
+
+    def assertSameOutput(self, data):
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_datetimes(self):
+        self.assertSameOutput({
+            'utc': datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+            'offset': datetime(
+                2026, 1, 2, 3, 4, 5, tzinfo=dt_timezone(timedelta(hours=5, minutes=30))
+            ),
+            'naive': datetime(2026, 1, 2, 3, 4, 5),
+            'now': timezone.now(),
+            'date': date(2026, 1, 2),
+            'time': time(3, 4, 5, 120000),
+        })
+
+    def test_lazy_strings(self):
+        self.assertSameOutput({'detail': gettext_lazy('Not found.')})
+
+    def test_decimal_and_uuid(self):
+        self.assertSameOutput({
+            'rating': Decimal('4.50'),
+            'whole': Decimal('3'),
+            'id': uuid.UUID(int=5),
+        })
+
+    def test_line_separators(self):
+        self.assertSameOutput({'text': 'a\u2028b\u2029c é 日本'})
+
+    def test_non_string_keys(self):
+        self.assertSameOutput({1: 'one', 'nested': [1, 2.5, None, True]})
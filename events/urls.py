@@ -1,9 +1,10 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from .views import EventViewSet, RSVPViewSet, ReviewViewSet, UserProfileViewSet
 
 # Create a router and register our viewsets
-router = DefaultRouter()
+# SimpleRouter skips DefaultRouter's API root view and format suffix routes
+router = SimpleRouter()
 router.register(r'events', EventViewSet, basename='event')
 router.register(r'rsvps', RSVPViewSet, basename='rsvp')
 router.register(r'reviews', ReviewViewSet, basename='review')
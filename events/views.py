@@ -1,13 +1,19 @@
+import hashlib
+
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.views.decorators.vary import vary_on_headers
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db import models  
+from django.db import models, transaction, IntegrityError
 from rest_framework import viewsets, status, filters
 from rest_framework import serializers  
 from rest_framework.exceptions import PermissionDenied  
+from rest_framework.pagination import PageNumberPagination
 
 from .models import Event, RSVP, Review, UserProfile
 from .serializers import (
@@ -19,6 +25,55 @@ from .serializers import (
     UserProfileSerializer
 )
 from .permissions import IsOrganizerOrReadOnly
+from .cache import cache_event_list
+from .pagination import EventCursorPagination, UserProfileCursorPagination
+
+
+def save_review(serializer, **kwargs):
+    """
+    Save a review without checking for an existing one first.
+    Review's unique_together on (event, user) is the source of truth,
+    so a duplicate surfaces as an IntegrityError from the insert.
+    """
+    try:
+        with transaction.atomic():
+            return serializer.save(**kwargs)
+    except IntegrityError:
+        raise serializers.ValidationError('You have already reviewed this event.')
+
+
+def visible_events(queryset, user):
+    """
+    Filter events based on visibility.
+    Unauthenticated users see only public events.
+    Authenticated users see public events + their own private events.
+    """
+    if not user.is_authenticated:
+        return queryset.filter(is_public=True)
+    
+    # Show public events + user's own events (public or private)
+    return queryset.filter(
+        models.Q(is_public=True) | models.Q(organizer=user)
+    )
+
+
+def event_etag(request, pk=None):
+    """
+    Fingerprint of what the event detail shows to this caller: the event,
+    its organizer's names, and the stats its RSVPs and reviews update.
+    Review authors' names aren't covered, so a renamed reviewer can stay
+    stale in a client's copy until the event or its stats next change.
+    """
+    row = visible_events(Event.objects.filter(pk=pk), request.user).values_list(
+        'updated_at', 'organizer__username', 'organizer__profile__full_name',
+        'stats__updated_at', 'stats__going_count',
+        'stats__review_count', 'stats__rating_total',
+    ).first()
+    if row is None:
+        return None
+    # The body carries the caller's own RSVP status, so tags are per user
+    caller = request.user.pk or 'anon'
+    return hashlib.sha256(repr((caller, row)).encode()).hexdigest()
 
 
 class EventViewSet(viewsets.ModelViewSet):
@@ -28,6 +83,7 @@ class EventViewSet(viewsets.ModelViewSet):
     Only organizers can modify their own events.
     """
     permission_classes = [IsAuthenticatedOrReadOnly, IsOrganizerOrReadOnly]
+    pagination_class = EventCursorPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['location', 'organizer', 'is_public']
     search_fields = ['title', 'description', 'location']
@@ -36,20 +92,65 @@ class EventViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """
-        Filter events based on visibility.
-        Unauthenticated users see only public events.
-        Authenticated users see public events + their own private events.
+        Events visible to the current user.
+        RSVP count and average rating come from the joined EventStats row.
         """
-        queryset = Event.objects.select_related('organizer', 'organizer__profile')
+        queryset = Event.objects.select_related(
+            'organizer', 'organizer__profile', 'stats'
+        ).annotate(
+            user_rsvp_status=self._user_rsvp_status(),
+        )
         
-        if not self.request.user.is_authenticated:
-            return queryset.filter(is_public=True)
+        if self.action == 'list':
+            # Plain rows for EventListSerializer: only the columns it reads,
+            # and no model instances. The ordering fields are selected too,
+            # since CursorPagination reads the cursor position from the row.
+            columns = EventListSerializer.columns
+            queryset = queryset.values(*columns, *(
+                field for field in self.ordering_fields if field not in columns
+            ))
+        elif self.action == 'retrieve':
+            queryset = self._prefetch_detail(queryset)
         
-        # Show public events + user's own events (public or private)
-        return queryset.filter(
-            models.Q(is_public=True) | models.Q(organizer=self.request.user)
+        return visible_events(queryset, self.request.user)
+    
+    def _user_rsvp_status(self):
+        """
+        Correlated subquery for the current user's RSVP status,
+        so every row gets it from the same SELECT.
+        """
+        if not self.request.user.is_authenticated:
+            return models.Value(None, output_field=models.CharField())
+        return models.Subquery(
+            RSVP.objects.filter(
+                event=models.OuterRef('pk'), user=self.request.user
+            ).values('status')[:1]
         )
     
+    def _prefetch_detail(self, queryset):
+        """Prefetch the reviews EventDetailSerializer renders, with their authors"""
+        return queryset.prefetch_related(
+            models.Prefetch(
+                'reviews',
+                queryset=Review.objects.select_related('user', 'user__profile')
+            ),
+        )
+    
+    @method_decorator(cache_event_list(60 * 5))
+    @method_decorator(vary_on_headers('Authorization'))
+    def list(self, request, *args, **kwargs):
+        """
+        Cached per Authorization header, since visibility depends on the user.
+        Event, RSVP, review, user and profile signals invalidate the cache.
+        """
+        return super().list(request, *args, **kwargs)
+    
+    @method_decorator(vary_on_headers('Authorization'))
+    @method_decorator(condition(etag_func=event_etag))
+    def retrieve(self, request, *args, **kwargs):
+        """Answer If-None-Match with a 304 before loading the event"""
+        return super().retrieve(request, *args, **kwargs)
+    
     def get_serializer_class(self):
         """Use different serializers for different actions"""
         if self.action == 'list':
@@ -71,26 +172,37 @@ class EventViewSet(viewsets.ModelViewSet):
         """
         event = self.get_object()
         user = request.user
+        rsvp_status = request.data.get('status')
         
-        # Check if RSVP already exists
-        rsvp, created = RSVP.objects.get_or_create(
-            event=event,
-            user=user,
-            defaults={'status': request.data.get('status', 'Maybe')}
-        )
+        if rsvp_status is not None and rsvp_status not in RSVP.STATUS_VALUES:
+            raise serializers.ValidationError({
+                'status': [f"Status must be one of: {', '.join(RSVP.STATUS_VALUES)}"]
+            })
         
-        if not created:
-            # Update existing RSVP
-            serializer = RSVPSerializer(rsvp, data=request.data, partial=True)
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_200_OK)
+        if rsvp_status is None:
+            # Nothing to change; create with the default status if missing
+            rsvp, created = RSVP.objects.get_or_create(event=event, user=user)
+        else:
+            rsvp, created = RSVP.objects.update_or_create(
+                event=event,
+                user=user,
+                defaults={'status': rsvp_status}
+            )
         
-        # Return newly created RSVP
+        # Reuse the event and user already loaded instead of refetching them
+        rsvp.event, rsvp.user = event, user
         serializer = RSVPSerializer(rsvp)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(
+            serializer.data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
+        )
     
-    @action(detail=True, methods=['get', 'post'], permission_classes=[IsAuthenticatedOrReadOnly])
+    @action(
+        detail=True,
+        methods=['get', 'post'],
+        permission_classes=[IsAuthenticatedOrReadOnly],
+        pagination_class=PageNumberPagination,
+    )
     def reviews(self, request, pk=None):
         """
         GET: List all reviews for an event
@@ -108,19 +220,12 @@ class EventViewSet(viewsets.ModelViewSet):
             return Response(serializer.data)
         
         elif request.method == 'POST':
-            # Check if user already reviewed this event
-            if Review.objects.filter(event=event, user=request.user).exists():
-                return Response(
-                    {'detail': 'You have already reviewed this event.'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
             serializer = ReviewSerializer(
                 data=request.data,
                 context={'request': request, 'event': event}
             )
             serializer.is_valid(raise_exception=True)
-            serializer.save()
+            save_review(serializer)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
@@ -135,7 +240,7 @@ class RSVPViewSet(viewsets.ReadOnlyModelViewSet):
     def get_queryset(self):
         """Return RSVPs for the current user"""
         return RSVP.objects.filter(user=self.request.user).select_related(
-            'event', 'event__organizer'
+            'event', 'user', 'user__profile'
         )
 
 
@@ -149,7 +254,7 @@ class ReviewViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Return all reviews, filtered by event if specified"""
-        queryset = Review.objects.select_related('user', 'user__profile', 'event')
+        queryset = Review.objects.select_related('user', 'user__profile')
         event_id = self.request.query_params.get('event', None)
         if event_id:
             queryset = queryset.filter(event_id=event_id)
@@ -159,12 +264,7 @@ class ReviewViewSet(viewsets.ModelViewSet):
         """Set the user to the current user"""
         event_id = self.request.data.get('event')
         event = get_object_or_404(Event, id=event_id)
-        
-        # Check if user already reviewed this event
-        if Review.objects.filter(event=event, user=self.request.user).exists():
-            raise serializers.ValidationError('You have already reviewed this event.')
-        
-        serializer.save(user=self.request.user, event=event)
+        save_review(serializer, user=self.request.user, event=event)
     
     def update(self, request, *args, **kwargs):
         """Only allow users to update their own reviews"""
@@ -194,9 +294,25 @@ class UserProfileViewSet(viewsets.ModelViewSet):
     """
     serializer_class = UserProfileSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = UserProfileCursorPagination
+    # Cursors are read off model attributes, so only the profile's own
+    # columns can be ordered on; profiles have no natural order beyond id
+    ordering_fields = ['id', 'full_name', 'location']
+    ordering = ['id']
     
     def get_queryset(self):
-        return UserProfile.objects.select_related('user').all()
+        """
+        Lists load only the serialized columns; retrieve and writes
+        fetch the full rows by primary key.
+        """
+        queryset = UserProfile.objects.select_related('user')
+        if self.action == 'list':
+            # Skip the password hash and other account columns on User
+            queryset = queryset.only(
+                'full_name', 'bio', 'location', 'profile_picture',
+                'user__username', 'user__email',
+            )
+        return queryset
     
     def perform_update(self, serializer):
         """Ensure users can only update their own profile"""